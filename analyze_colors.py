@@ -1,18 +1,15 @@
 import numpy as np
-
-# ==========================================
-# 🚑 紧急修复: 给 colormath 库打补丁
-# ==========================================
-def patch_asscalar(a):
-    return a.item()
-setattr(np, "asscalar", patch_asscalar)
-
-# 补丁打完后再引入 colormath
-from colormath.color_objects import sRGBColor, LabColor
-from colormath.color_conversions import convert_color
-from colormath.color_diff import delta_e_cie2000
-import itertools
+from scipy.spatial import cKDTree
+import hashlib
 import os
+import zipfile
+
+# Numba 可选: 安装后混色和贪心筛选会编译为本地代码, 否则使用 NumPy/KD-tree 版本
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 # ================= 配置区域 =================
 
@@ -36,6 +33,15 @@ FILAMENTS = {
 # RGB距离阈值 (和6色算法一致)
 RGB_DISTANCE_THRESHOLD = 8
 
+# 筛选策略
+#   "threshold": 按全排列顺序贪心 + RGB距离阈值 (和6色算法一致, 生成现有 smart_8color_stacks.npy)
+#   "kcenter":   最远点采样 (k-center), 每次选离已选集合最远的颜色, RGB空间覆盖更均匀
+#                注意: 会改变校准板的堆叠顺序, 已打印的8色校准板/LUT需要重新制作
+SELECTION_STRATEGY = "threshold"
+
+# 阶段1模拟结果缓存目录 (按耗材/层高/层数/底板配置的哈希命名, 配置不变时重跑直接读取)
+SIM_CACHE_DIR = os.path.join("output", ".analyze_cache")
+
 # ===========================================
 
 def calculate_alpha(td_value, layer_height):
@@ -45,23 +51,219 @@ def calculate_alpha(td_value, layer_height):
     alpha = layer_height / blending_distance
     return min(max(alpha, 0.0), 1.0)
 
-def mix_colors(stack):
+# 耗材查找表 (按ID索引), 混色时直接数组索引
+FIL_RGB = np.array([FILAMENTS[i]["rgb"] for i in range(len(FILAMENTS))], dtype=np.float64)    # (8, 3)
+FIL_ALPHA = np.array([calculate_alpha(FILAMENTS[i]["td"], LAYER_HEIGHT)
+                      for i in range(len(FILAMENTS))], dtype=np.float64)                      # (8,)
+
+def mix_colors(stacks):
     """
-    颜色混合模拟 (和6色算法一致)
-    stack: [底层 ... 顶层]
+    颜色混合模拟 (和6色算法一致, 向量化版本)
+    stacks: (N, LAYERS) 耗材ID数组, 每行 [底层 ... 顶层]
+    返回: (N, 3) uint8 最终颜色
     """
-    current_rgb = BACKING_COLOR.astype(float)
-    for fid in stack:
-        fil = FILAMENTS[fid]
-        f_rgb = np.array(fil["rgb"])
-        f_alpha = calculate_alpha(fil["td"], LAYER_HEIGHT)
-        current_rgb = f_rgb * f_alpha + current_rgb * (1.0 - f_alpha)
+    backing = BACKING_COLOR.astype(np.float64)
+
+    if HAS_NUMBA:
+        return _mix_colors_jit(stacks, FIL_RGB, FIL_ALPHA, backing)
+
+    # 按和逐层叠加相同的运算顺序计算 (只是对全部组合同时做), 结果逐位一致, 不需要取整修正
+    alpha = FIL_ALPHA[stacks][:, :, None]  # (N, LAYERS, 1)
+    rgb = FIL_RGB[stacks]                   # (N, LAYERS, 3)
+    current_rgb = np.broadcast_to(backing, (len(stacks), 3))
+    for k in range(stacks.shape[1]):
+        current_rgb = rgb[:, k] * alpha[:, k] + current_rgb * (1.0 - alpha[:, k])
     return current_rgb.astype(np.uint8)
 
-def rgb_to_lab(rgb):
-    """RGB转Lab (用于可选的色差分析)"""
-    rgb_obj = sRGBColor(rgb[0]/255.0, rgb[1]/255.0, rgb[2]/255.0)
-    return convert_color(rgb_obj, LabColor)
+def all_stacks(color_count, layers):
+    """生成全排列 (和 itertools.product 相同的顺序), 形状 (color_count**layers, layers)"""
+    # 第 n 个组合就是 n 的 color_count 进制表示 (高位在前 = 底层)
+    idx = np.arange(color_count ** layers, dtype=np.int64)[:, None]
+    place = color_count ** np.arange(layers - 1, -1, -1, dtype=np.int64)
+    return ((idx // place) % color_count).astype(np.uint8)
+
+def simulate_candidates(color_count, layers):
+    """
+    阶段1: 模拟全部 color_count**layers 种组合, 结果按配置哈希缓存到 SIM_CACHE_DIR
+    返回: (cand_stacks, cand_rgb, from_cache)
+    """
+    cfg_key = repr((FILAMENTS, LAYER_HEIGHT, layers, color_count, BACKING_COLOR.tolist()))
+    cfg_hash = hashlib.sha1(cfg_key.encode("utf-8")).hexdigest()[:12]
+    cache_path = os.path.join(SIM_CACHE_DIR, f"sim_{cfg_hash}.npz")
+    
+    if os.path.exists(cache_path):
+        try:
+            with np.load(cache_path) as data:
+                return data["stacks"], data["rgb"], True
+        except (OSError, EOFError, ValueError, KeyError, zipfile.BadZipFile):
+            pass  # 缓存损坏 (例如上次写入被中断), 重新计算并覆盖
+    
+    cand_stacks = all_stacks(color_count, layers)   # (N, LAYERS) uint8
+    cand_rgb = mix_colors(cand_stacks)               # (N, 3) uint8
+    
+    # 先写临时文件再原子替换, 中断时不会留下半截的缓存
+    os.makedirs(SIM_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            np.savez(f, stacks=cand_stacks, rgb=cand_rgb)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return cand_stacks, cand_rgb, False
+
+def select_distinct(cand_rgb, seed_idx, threshold, target):
+    """
+    贪心筛选 (仿6色算法): 按全排列顺序遍历, 与所有已选颜色距离都 >= threshold 才入选
+    返回: 已选候选索引列表 (种子在前)
+    """
+    N = len(cand_rgb)
+    selected_idx = []
+    eligible = np.ones(N, dtype=bool)           # 与所有已选颜色距离都 >= 阈值
+    
+    # RGB 只有3维, KD-tree 只需访问阈值球内的少量邻居
+    tree = cKDTree(cand_rgb.astype(np.float32))
+    # 原算法是严格小于阈值才排除, 而 query_ball_point 包含边界
+    exclusion_radius = np.nextafter(threshold, 0)
+    
+    def select(j):
+        """选中候选 j, 并把其阈值范围内的候选标记为不可选 (包括 j 自身)"""
+        selected_idx.append(j)
+        eligible[tree.query_ball_point(cand_rgb[j], r=exclusion_radius)] = False
+    
+    for j in seed_idx:
+        select(j)
+    
+    for i in range(N):
+        if len(selected_idx) >= target:
+            break
+        
+        # 检查RGB距离 (是否落在任一已选颜色的阈值范围内)
+        if eligible[i]:
+            select(i)
+            
+            # 进度显示
+            if len(selected_idx) % 500 == 0:
+                print(f"     进度: {len(selected_idx)}/{target}")
+    
+    return selected_idx
+
+def select_kcenter(cand_rgb, seed_idx, target):
+    """
+    最远点采样 (greedy k-center, 2-近似最优覆盖): 每次选取离已选集合最远的候选
+    返回: 已选候选索引列表 (种子在前), 总是正好 target 个
+    """
+    N = len(cand_rgb)
+    selected_idx = []
+    # 每个候选到已选集合的最近RGB距离的平方 (开方是单调的, argmax 不受影响)
+    min_dist2 = np.full(N, np.iinfo(np.int64).max, dtype=np.int64)
+    
+    # 有符号类型只转换一次, 循环内复用缓冲区, 避免每次选中都分配 (N, 3) 临时数组
+    rgb = cand_rgb.astype(np.int64)
+    diff = np.empty_like(rgb)
+    d2 = np.empty(N, dtype=np.int64)
+    
+    def select(j):
+        selected_idx.append(j)
+        np.subtract(rgb, rgb[j], out=diff)
+        np.einsum('ij,ij->i', diff, diff, out=d2)
+        np.minimum(min_dist2, d2, out=min_dist2)
+        min_dist2[j] = -1                       # 已选中的不再参与 argmax (即使有同色候选)
+    
+    for j in seed_idx:
+        select(j)
+    
+    while len(selected_idx) < min(target, N):
+        select(int(np.argmax(min_dist2)))
+        
+        # 进度显示
+        if len(selected_idx) % 500 == 0:
+            print(f"     进度: {len(selected_idx)}/{target}")
+    
+    return selected_idx
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _mix_colors_jit(stacks, fil_rgb, fil_alpha, backing):
+        """mix_colors 的 Numba 版本 (不开 fastmath, 保证和 NumPy 版逐位一致)"""
+        N, L = stacks.shape
+        out = np.empty((N, 3), dtype=np.uint8)
+        for n in prange(N):
+            for c in range(3):
+                cur = backing[c]
+                for k in range(L):
+                    f = stacks[n, k]
+                    a = fil_alpha[f]
+                    cur = fil_rgb[f, c] * a + cur * (1.0 - a)
+                out[n, c] = np.uint8(cur)
+        return out
+
+    @njit(cache=True)
+    def _select_distinct_jit(cand_rgb, seed_idx, threshold, target):
+        """
+        select_distinct 的 Numba 版本
+        已选颜色放进边长为阈值的规则网格 (空间哈希): 距离 < 阈值的点只可能在相邻的
+        3x3x3 个格子里, 每个候选只需检查这 27 个格子, 和已选数量无关
+        """
+        N = cand_rgb.shape[0]
+        rgb = cand_rgb.astype(np.int32)
+        threshold2 = threshold * threshold       # 比较距离平方, 省去开方
+        
+        cell = max(int(np.ceil(threshold)), 1)
+        dim = 256 // cell + 3                    # 两侧各留一格, 邻居查找无需边界判断
+        keys = rgb // cell + 1
+        bucket = (keys[:, 0] * dim + keys[:, 1]) * dim + keys[:, 2]
+        # 27 个相邻格子的 bucket 偏移
+        offsets = np.empty(27, dtype=np.int64)
+        n_off = 0
+        for a in range(-1, 2):
+            for b in range(-1, 2):
+                for c in range(-1, 2):
+                    offsets[n_off] = (a * dim + b) * dim + c
+                    n_off += 1
+        
+        # 每个格子里的已选颜色用链表串起来: head[格子] -> 已选序号, next_in_bucket[序号] -> 下一个
+        head = np.full(dim * dim * dim, -1, dtype=np.int64)
+        next_in_bucket = np.empty(target, dtype=np.int64)
+        selected_idx = np.empty(target, dtype=np.int64)
+        selected_mask = np.zeros(N, dtype=np.bool_)
+        count = 0
+        
+        for s in range(len(seed_idx) + N):
+            if count >= target:
+                break
+            if s < len(seed_idx):
+                i = seed_idx[s]                  # 种子无条件入选
+            else:
+                i = s - len(seed_idx)
+                if selected_mask[i]:
+                    continue
+                
+                is_distinct = True
+                for o in range(27):
+                    t = head[bucket[i] + offsets[o]]
+                    while t >= 0:
+                        j = selected_idx[t]
+                        dr = rgb[i, 0] - rgb[j, 0]
+                        dg = rgb[i, 1] - rgb[j, 1]
+                        db = rgb[i, 2] - rgb[j, 2]
+                        if dr * dr + dg * dg + db * db < threshold2:
+                            is_distinct = False
+                            break
+                        t = next_in_bucket[t]
+                    if not is_distinct:
+                        break
+                if not is_distinct:
+                    continue
+            
+            selected_idx[count] = i
+            selected_mask[i] = True
+            next_in_bucket[count] = head[bucket[i]]
+            head[bucket[i]] = count
+            count += 1
+        
+        return selected_idx[:count]
 
 def main():
     COLOR_COUNT = 8 
@@ -78,90 +280,63 @@ def main():
     
     # ==================== 阶段1: 模拟所有组合 ====================
     print("[阶段1] 模拟所有颜色组合...")
-    candidates = []
+    cand_stacks, cand_rgb, from_cache = simulate_candidates(COLOR_COUNT, LAYERS)
+    N = len(cand_stacks)
     
-    for stack in itertools.product(range(COLOR_COUNT), repeat=LAYERS):
-        final_rgb = mix_colors(stack)
-        
-        # 转换到Lab用于可选分析
-        lab = rgb_to_lab(final_rgb)
-        
-        candidates.append({
-            "stack": stack,
-            "rgb": final_rgb,
-            "lab": lab
-        })
-    
-    print(f"✅ 模拟完成: {len(candidates)} 个组合")
+    print(f"✅ 模拟完成: {N} 个组合" + (" (读取缓存)" if from_cache else ""))
     print()
     
     # ==================== 阶段2: 智能筛选 (仿6色算法) ====================
     print("[阶段2] 智能筛选 (贪心算法 + RGB距离)")
     
-    selected = []
-    
     # Step 1: 预选种子颜色 (8个纯色)
     print("  → 预选种子颜色 (8个纯色)...")
-    for i in range(COLOR_COUNT):
-        stack = (i,) * LAYERS
-        for c in candidates:
-            if c['stack'] == stack:
-                selected.append(c)
-                print(f"     种子 {i}: {FILAMENTS[i]['name']} - RGB{tuple(c['rgb'])}")
-                break
+    # 纯色 (i,i,...,i) 在全排列中的位置: i * (C^L - 1) / (C - 1)
+    seed_step = (COLOR_COUNT ** LAYERS - 1) // (COLOR_COUNT - 1)
+    seed_idx = [i * seed_step for i in range(COLOR_COUNT)]
+    for i, j in enumerate(seed_idx):
+        print(f"     种子 {i}: {FILAMENTS[i]['name']} - RGB{tuple(cand_rgb[j])}")
     
-    print(f"  ✓ 种子颜色: {len(selected)} 个")
+    print(f"  ✓ 种子颜色: {len(seed_idx)} 个")
     print()
     
     # Step 2: 高质量筛选 (RGB距离 > 8)
-    print(f"  → 高质量筛选 (RGB距离 > {RGB_DISTANCE_THRESHOLD})...")
-    round1_start = len(selected)
+    if TARGET_COUNT >= N:
+        # 所有组合都会入选, 距离筛选没有意义, 直接交给 Step 3 全部填充
+        print(f"  → 目标数量 >= 组合数 ({N}), 跳过距离筛选")
+        selected_idx = list(seed_idx)
+    elif SELECTION_STRATEGY == "kcenter":
+        print("  → 最远点采样 (k-center)...")
+        selected_idx = select_kcenter(cand_rgb, seed_idx, TARGET_COUNT)
+    elif HAS_NUMBA:
+        print(f"  → 高质量筛选 (RGB距离 > {RGB_DISTANCE_THRESHOLD})...")
+        selected_idx = _select_distinct_jit(
+            cand_rgb, np.array(seed_idx, dtype=np.int64),
+            RGB_DISTANCE_THRESHOLD, TARGET_COUNT).tolist()
+    else:
+        print(f"  → 高质量筛选 (RGB距离 > {RGB_DISTANCE_THRESHOLD})...")
+        selected_idx = select_distinct(cand_rgb, seed_idx, RGB_DISTANCE_THRESHOLD, TARGET_COUNT)
     
-    for c in candidates:
-        if len(selected) >= TARGET_COUNT:
-            break
-        
-        # 跳过已选中的
-        if any(c['stack'] == s['stack'] for s in selected):
-            continue
-        
-        # 检查RGB距离
-        is_distinct = True
-        for s in selected:
-            rgb_dist = np.linalg.norm(c['rgb'].astype(int) - s['rgb'].astype(int))
-            if rgb_dist < RGB_DISTANCE_THRESHOLD:
-                is_distinct = False
-                break
-        
-        if is_distinct:
-            selected.append(c)
-        
-        # 进度显示
-        if len(selected) % 500 == 0:
-            print(f"     进度: {len(selected)}/{TARGET_COUNT}")
-    
-    round1_count = len(selected) - round1_start
-    print(f"  ✓ 高质量筛选: 新增 {round1_count} 个颜色")
+    round1_count = len(selected_idx) - len(seed_idx)
+    round1_name = "最远点采样" if SELECTION_STRATEGY == "kcenter" else "高质量筛选"
+    print(f"  ✓ {round1_name}: 新增 {round1_count} 个颜色")
     print()
     
     # Step 3: 填充剩余 (降低阈值)
-    if len(selected) < TARGET_COUNT:
-        print(f"  → 填充剩余 {TARGET_COUNT - len(selected)} 个位置...")
-        for c in candidates:
-            if len(selected) >= TARGET_COUNT:
-                break
-            if any(c['stack'] == s['stack'] for s in selected):
-                continue
-            selected.append(c)
+    if len(selected_idx) < TARGET_COUNT:
+        print(f"  → 填充剩余 {TARGET_COUNT - len(selected_idx)} 个位置...")
+        # 按原顺序取尚未选中的候选
+        remaining = np.setdiff1d(np.arange(N), np.asarray(selected_idx), assume_unique=True)
+        selected_idx.extend(remaining[:TARGET_COUNT - len(selected_idx)].tolist())
         
-        print(f"  ✓ 填充完成: 总计 {len(selected)} 个颜色")
+        print(f"  ✓ 填充完成: 总计 {len(selected_idx)} 个颜色")
     
     print()
     print("=" * 60)
     print(f"🎉 筛选完成!")
-    print(f"   总组合数: {len(candidates)}")
-    print(f"   最终选择: {len(selected)}")
-    print(f"   筛选率: {len(selected)/len(candidates)*100:.2f}%")
+    print(f"   总组合数: {N}")
+    print(f"   最终选择: {len(selected_idx)}")
+    print(f"   筛选率: {len(selected_idx)/N*100:.2f}%")
     print("=" * 60)
     print()
     
@@ -171,17 +346,16 @@ def main():
     print(f"💾 保存到 '{output_dir}/'...")
     
     # 确保数量正确
-    final_selection = selected[:TARGET_COUNT]
+    final_idx = np.asarray(selected_idx[:TARGET_COUNT], dtype=np.int64)
     
     # 如果不足，用白色填充
-    if len(final_selection) < TARGET_COUNT:
+    deficit = TARGET_COUNT - len(final_idx)
+    if deficit > 0:
         print(f"⚠️  不足 {TARGET_COUNT} 个，用白色填充...")
-        dummy_stack = (0,) * LAYERS  # 白色
-        while len(final_selection) < TARGET_COUNT:
-            final_selection.append({"stack": dummy_stack})
+        # 白色 (0,0,...,0) 是全排列的第一个
+        final_idx = np.concatenate([final_idx, np.zeros(deficit, dtype=np.int64)])
     
-    stacks_data = [item["stack"] for item in final_selection]
-    stacks_array = np.array(stacks_data, dtype=np.uint8)
+    stacks_array = cand_stacks[final_idx].astype(np.uint8, copy=False)
     
     if not os.path.exists(output_dir): 
         os.makedirs(output_dir)
@@ -201,16 +375,17 @@ def main():
     
     # 统计黑色使用情况 (修正：黑色现在的 ID 是 4)
     BLACK_ID = 4
-    black_count = sum(1 for s in final_selection if BLACK_ID in s['stack'])
-    black_surface = sum(1 for s in final_selection if s['stack'][4] == BLACK_ID)
+    final_count = len(final_idx)
+    black_count = int(np.any(stacks_array == BLACK_ID, axis=1).sum())
+    black_surface = int((stacks_array[:, -1] == BLACK_ID).sum())   # 顶层 = 表面层
     
     print(f"黑色使用统计 (ID={BLACK_ID}):")
-    print(f"  包含黑色的组合: {black_count}/{len(final_selection)} ({black_count/len(final_selection)*100:.1f}%)")
-    print(f"  表面层是黑色: {black_surface}/{len(final_selection)} ({black_surface/len(final_selection)*100:.1f}%)")
+    print(f"  包含黑色的组合: {black_count}/{final_count} ({black_count/final_count*100:.1f}%)")
+    print(f"  表面层是黑色: {black_surface}/{final_count} ({black_surface/final_count*100:.1f}%)")
     print()
     
     # RGB分布统计
-    all_rgb = np.array([s['rgb'] for s in final_selection])
+    all_rgb = cand_rgb[final_idx]
     print(f"RGB分布:")
     print(f"  R: min={all_rgb[:,0].min()}, max={all_rgb[:,0].max()}, avg={all_rgb[:,0].mean():.1f}")
     print(f"  G: min={all_rgb[:,1].min()}, max={all_rgb[:,1].max()}, avg={all_rgb[:,1].mean():.1f}")
@@ -43,39 +43,29 @@ def create_pixel_art():
     
     # Create a small pixel art (will be scaled up)
     size = 32
-    img = Image.new('RGB', (size, size), 'white')
-    pixels = img.load()
     
     # Create a simple pattern (smiley face)
-    # Background
-    for y in range(size):
-        for x in range(size):
-            pixels[x, y] = (255, 255, 255)  # White background
-    
-    # Yellow circle (face)
+    # Background + yellow circle (face)
+    # The face keeps the strict dx²+dy² < r² disc mask: ImageDraw.ellipse rasterizes
+    # a slightly different outline and would change the committed pixel_art.png
     center_x, center_y = size // 2, size // 2
     radius = size // 3
-    for y in range(size):
-        for x in range(size):
-            dx, dy = x - center_x, y - center_y
-            if dx*dx + dy*dy < radius*radius:
-                pixels[x, y] = (255, 230, 0)  # Yellow
+    yy, xx = np.ogrid[:size, :size]
+    face_mask = (xx - center_x)**2 + (yy - center_y)**2 < radius*radius
+    
+    arr = np.full((size, size, 3), 255, dtype=np.uint8)  # White background
+    arr[face_mask] = (255, 230, 0)  # Yellow
+    img = Image.fromarray(arr)
+    draw = ImageDraw.Draw(img)
     
-    # Eyes (black)
+    # Eyes (black), 2x3 px each - rectangle bounds are inclusive
     eye_y = center_y - 4
-    for y in range(eye_y - 1, eye_y + 2):
-        for x in range(center_x - 6, center_x - 4):
-            if 0 <= x < size and 0 <= y < size:
-                pixels[x, y] = (0, 0, 0)
-        for x in range(center_x + 4, center_x + 6):
-            if 0 <= x < size and 0 <= y < size:
-                pixels[x, y] = (0, 0, 0)
+    draw.rectangle([center_x - 6, eye_y - 1, center_x - 5, eye_y + 1], fill=(0, 0, 0))
+    draw.rectangle([center_x + 4, eye_y - 1, center_x + 5, eye_y + 1], fill=(0, 0, 0))
     
     # Smile (red)
     mouth_y = center_y + 3
-    for x in range(center_x - 5, center_x + 6):
-        if 0 <= x < size and 0 <= mouth_y < size:
-            pixels[x, mouth_y] = (220, 20, 60)  # Red
+    draw.rectangle([center_x - 5, mouth_y, center_x + 5, mouth_y], fill=(220, 20, 60))  # Red
     
     # Scale up for better visibility
     img = img.resize((256, 256), Image.NEAREST)
@@ -89,30 +79,23 @@ def create_photo():
     print("Creating photo.jpg...")
     
     width, height = 400, 400
-    img = Image.new('RGB', (width, height))
-    pixels = img.load()
     
-    # Create a colorful gradient with circular pattern
+    # Create a colorful gradient with circular pattern (vectorized over all pixels)
     center_x, center_y = width // 2, height // 2
     max_dist = np.sqrt(center_x**2 + center_y**2)
     
-    for y in range(height):
-        for x in range(width):
-            # Calculate distance from center
-            dx, dy = x - center_x, y - center_y
-            dist = np.sqrt(dx*dx + dy*dy)
-            
-            # Create radial gradient
-            r = int(255 * (1 - dist / max_dist))
-            g = int(255 * (x / width))
-            b = int(255 * (y / height))
-            
-            # Clamp values
-            r = max(0, min(255, r))
-            g = max(0, min(255, g))
-            b = max(0, min(255, b))
-            
-            pixels[x, y] = (r, g, b)
+    yy, xx = np.ogrid[:height, :width]
+    dx, dy = xx - center_x, yy - center_y
+    dist = np.sqrt(dx*dx + dy*dy)
+    
+    # Radial gradient on red, horizontal on green, vertical on blue
+    # (truncate like int(), then clamp to 0..255)
+    r = (255 * (1 - dist / max_dist)).astype(np.int64)
+    g = (255 * (xx / width)).astype(np.int64)
+    b = (255 * (yy / height)).astype(np.int64)
+    
+    rgb = np.stack(np.broadcast_arrays(r, g, b), axis=-1)
+    img = Image.fromarray(np.clip(rgb, 0, 255).astype(np.uint8))
     
     # Add some geometric shapes for interest
     draw = ImageDraw.Draw(img)
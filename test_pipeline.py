@@ -47,17 +47,40 @@ TEST COVERAGE MATRIX:
 └─────────────────────────────────────────────────────────────────────────────┘
 """
 
+import io
 import os
+import re
+import codecs
+import shutil
 import sys
+import glob
+import json
 import time
+import hashlib
+import argparse
+import statistics
+import functools
 import traceback
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, List, Tuple, Optional
-import numpy as np
+
+try:
+    import trimesh
+except ImportError:
+    trimesh = None  # Mesh validation reports it as a failure
 
 # ========== Color Output Setup ==========
+# Pipes and CI log collectors get plain text: no escape codes, and no
+# colorama stdout wrapper on Windows
+IS_TTY = sys.stdout.isatty()
+
 try:
     from colorama import init, Fore, Style
-    init(autoreset=True)
+    if IS_TTY:
+        init(autoreset=True)
     HAS_COLOR = True
 except ImportError:
     # Fallback to ANSI codes if colorama not available
@@ -74,10 +97,43 @@ except ImportError:
     
     HAS_COLOR = True
 
+# Prebuilt color prefixes/suffix (bound once instead of Fore.*/Style.* lookups
+# per line); all empty when stdout is not a terminal
+HAS_COLOR = HAS_COLOR and IS_TTY
+if HAS_COLOR:
+    RESET = Style.RESET_ALL
+    RED = Fore.RED
+    GREEN = Fore.GREEN
+    YELLOW = Fore.YELLOW
+    RED_BRIGHT = Fore.RED + Style.BRIGHT
+    GREEN_BRIGHT = Fore.GREEN + Style.BRIGHT
+    YELLOW_BRIGHT = Fore.YELLOW + Style.BRIGHT
+    CYAN_BRIGHT = Fore.CYAN + Style.BRIGHT
+else:
+    RESET = RED = GREEN = YELLOW = ''
+    RED_BRIGHT = GREEN_BRIGHT = YELLOW_BRIGHT = CYAN_BRIGHT = ''
+
+# Prebuilt colored fragments used by the report printers
+SEPARATOR = '=' * 80
+SEP = f"{CYAN_BRIGHT}{SEPARATOR}{RESET}"
+ICON_PASS = f"{GREEN}✓{RESET}"
+ICON_FAIL = f"{RED}✗{RESET}"
+STATUS_PASS = f"{GREEN_BRIGHT}[PASS]{RESET}"
+STATUS_FAIL = f"{RED_BRIGHT}[FAIL]{RESET}"
+RED_X = f"{RED}✗ "
+BANNER = f"""{CYAN_BRIGHT}
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                    LUMINA STUDIO - AUTOMATED TEST PIPELINE                    ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+{RESET}
+"""
+BANNER_BYTES = (BANNER + '\n').encode('utf-8')
+
 # ========== Test Configuration ==========
 
 # Test cases configuration
-# Format: {
+# Each case starts from DEFAULTS; only the fields that differ are passed to case().
+# Fields:
 #     'name': 'Test Case Name',
 #     'image': 'path/to/image.png',  # Supports .png, .jpg, .svg
 #     'lut': 'path/to/lut.npy',
@@ -94,568 +150,215 @@ except ImportError:
 #     'separate_backing': False | True,
 #     'enable_cleanup': True | False,  # Isolated pixel cleanup (default: True)
 #     'expected_materials': 4 | 6 | 8,  # Expected number of material slots
-# }
+DEFAULTS = {
+    'color_mode': '4-Color',
+    'modeling_mode': 'high-fidelity',
+    'target_width_mm': 50.0,
+    'quantize_colors': 64,
+    'blur_kernel': 0,
+    'smooth_sigma': 10,
+    'structure_mode': 'Double-sided',
+    'auto_bg': True,
+    'bg_tol': 10,
+    'color_replacements': None,
+    'separate_backing': False,
+    'enable_cleanup': True,
+    'expected_materials': 4,
+}
+
+
+def case(name: str, **overrides) -> Dict:
+    """Build a test case dict from DEFAULTS plus per-case overrides."""
+    unknown = set(overrides) - set(DEFAULTS) - {'image', 'lut'}
+    if unknown:
+        raise KeyError(f"Unknown test case field(s) for '{name}': {sorted(unknown)}")
+    return {**DEFAULTS, 'name': name, **overrides}
+
 
 TEST_CASES = [
     # ========== 4-Color Mode Tests ==========
     # Test all modeling modes with 4-Color
-    {
-        'name': '4-Color | High-Fidelity | CMYW LUT',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_cmyw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
-    {
-        'name': '4-Color | High-Fidelity | RYBW LUT',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
-    {
-        'name': '4-Color | Pixel Art | RYBW LUT',
-        'image': 'test_images/pixel_art.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'pixel',
-        'target_width_mm': 40.0,
-        'quantize_colors': 32,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': False,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
-    {
-        'name': '4-Color | Pixel Art | CMYW LUT',
-        'image': 'test_images/pixel_art.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_cmyw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'pixel',
-        'target_width_mm': 40.0,
-        'quantize_colors': 32,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': False,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
-    {
-        'name': '4-Color | Vector Mode | SVG',
-        'image': 'test_images/1.svg',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'vector',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': False,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
+    case('4-Color | High-Fidelity | CMYW LUT',
+         image='test_images/sample_logo.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_cmyw.npy'),
+    case('4-Color | High-Fidelity | RYBW LUT',
+         image='test_images/sample_logo.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy'),
+    case('4-Color | Pixel Art | RYBW LUT',
+         image='test_images/pixel_art.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy', modeling_mode='pixel',
+         target_width_mm=40.0, quantize_colors=32, auto_bg=False),
+    case('4-Color | Pixel Art | CMYW LUT',
+         image='test_images/pixel_art.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_cmyw.npy', modeling_mode='pixel',
+         target_width_mm=40.0, quantize_colors=32, auto_bg=False),
+    case('4-Color | Vector Mode | SVG',
+         image='test_images/1.svg', lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
+         modeling_mode='vector', auto_bg=False),
     
     # ========== 6-Color Mode Tests ==========
-    {
-        'name': '6-Color | High-Fidelity | Photo',
-        'image': 'test_images/photo.jpg',
-        'lut': 'lut-npy预设/Custom/Bambulab_basic_cmywgk.npy',
-        'color_mode': '6-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 60.0,
-        'quantize_colors': 128,
-        'blur_kernel': 0,
-        'smooth_sigma': 15,
-        'structure_mode': 'Single-sided',
-        'auto_bg': True,
-        'bg_tol': 15,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 6,
-    },
-    {
-        'name': '6-Color | Pixel Art',
-        'image': 'test_images/pixel_art.png',
-        'lut': 'lut-npy预设/Custom/Bambulab_basic_cmywgk.npy',
-        'color_mode': '6-Color',
-        'modeling_mode': 'pixel',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': False,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 6,
-    },
+    case('6-Color | High-Fidelity | Photo',
+         image='test_images/photo.jpg', lut='lut-npy预设/Custom/Bambulab_basic_cmywgk.npy',
+         color_mode='6-Color', target_width_mm=60.0, quantize_colors=128, smooth_sigma=15,
+         structure_mode='Single-sided', bg_tol=15, expected_materials=6),
+    case('6-Color | Pixel Art',
+         image='test_images/pixel_art.png', lut='lut-npy预设/Custom/Bambulab_basic_cmywgk.npy',
+         color_mode='6-Color', modeling_mode='pixel', auto_bg=False, expected_materials=6),
     
     # ========== BW Mode Tests ==========
-    {
-        'name': 'BW | High-Fidelity',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/Custom/Bambulab_basic_BW.npy',
-        'color_mode': 'BW (Black & White)',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 32,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 2,
-    },
-    {
-        'name': 'BW | Pixel Art',
-        'image': 'test_images/pixel_art.png',
-        'lut': 'lut-npy预设/Custom/Bambulab_basic_BW.npy',
-        'color_mode': 'BW (Black & White)',
-        'modeling_mode': 'pixel',
-        'target_width_mm': 40.0,
-        'quantize_colors': 16,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': False,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 2,
-    },
+    case('BW | High-Fidelity',
+         image='test_images/sample_logo.png', lut='lut-npy预设/Custom/Bambulab_basic_BW.npy',
+         color_mode='BW (Black & White)', quantize_colors=32, expected_materials=2),
+    case('BW | Pixel Art',
+         image='test_images/pixel_art.png', lut='lut-npy预设/Custom/Bambulab_basic_BW.npy',
+         color_mode='BW (Black & White)', modeling_mode='pixel', target_width_mm=40.0,
+         quantize_colors=16, auto_bg=False, expected_materials=2),
     
     # ========== Structure Mode Tests ==========
-    {
-        'name': '4-Color | Single-sided',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Single-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
-    {
-        'name': '4-Color | Double-sided',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
+    case('4-Color | Single-sided',
+         image='test_images/sample_logo.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy', structure_mode='Single-sided'),
+    case('4-Color | Double-sided',
+         image='test_images/sample_logo.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy'),
     
     # ========== Color Quantization Tests ==========
-    {
-        'name': '4-Color | Quantize 8 colors',
-        'image': 'test_images/photo.jpg',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_cmyw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 8,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
-    {
-        'name': '4-Color | Quantize 256 colors',
-        'image': 'test_images/photo.jpg',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_cmyw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 256,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
+    case('4-Color | Quantize 8 colors',
+         image='test_images/photo.jpg', lut='lut-npy预设/bambulab/bambulab_pla_basic_cmyw.npy',
+         quantize_colors=8),
+    case('4-Color | Quantize 256 colors',
+         image='test_images/photo.jpg', lut='lut-npy预设/bambulab/bambulab_pla_basic_cmyw.npy',
+         quantize_colors=256),
     
     # ========== Filter Tests ==========
-    {
-        'name': '4-Color | Blur Filter (kernel=3)',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 3,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
-    {
-        'name': '4-Color | Smooth Filter (sigma=20)',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 20,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
+    case('4-Color | Blur Filter (kernel=3)',
+         image='test_images/sample_logo.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy', blur_kernel=3),
+    case('4-Color | Smooth Filter (sigma=20)',
+         image='test_images/sample_logo.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy', smooth_sigma=20),
     
     # ========== Background Removal Tests ==========
-    {
-        'name': '4-Color | Auto BG Removal ON',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
-    {
-        'name': '4-Color | Auto BG Removal OFF',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': False,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
+    case('4-Color | Auto BG Removal ON',
+         image='test_images/sample_logo.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy'),
+    case('4-Color | Auto BG Removal OFF',
+         image='test_images/sample_logo.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy', auto_bg=False),
     
     # ========== Color Replacement Tests ==========
-    {
-        'name': '4-Color | Color Replacement (Red→Green)',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': {'#DC143C': '#00FF00'},
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
-    {
-        'name': '4-Color | Multiple Color Replacements',
-        'image': 'test_images/simple_shapes.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_cmyw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': {
-            '#DC143C': '#0086D6',  # Red → Cyan
-            '#0064F0': '#EC008C',  # Blue → Magenta
-        },
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
+    case('4-Color | Color Replacement (Red→Green)',
+         image='test_images/sample_logo.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
+         color_replacements={'#DC143C': '#00FF00'}),
+    case('4-Color | Multiple Color Replacements',
+         image='test_images/simple_shapes.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_cmyw.npy',
+         color_replacements={
+             '#DC143C': '#0086D6',  # Red → Cyan
+             '#0064F0': '#EC008C',  # Blue → Magenta
+         }),
     
     # ========== Backing Separation Tests ==========
-    {
-        'name': '4-Color | Separate Backing ON',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_cmyw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': True,
-        'expected_materials': 5,  # 4 materials + 1 backing
-    },
-    {
-        'name': '4-Color | Separate Backing OFF',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_cmyw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
+    case('4-Color | Separate Backing ON',
+         image='test_images/sample_logo.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_cmyw.npy', separate_backing=True,
+         expected_materials=5),  # 4 materials + 1 backing
+    case('4-Color | Separate Backing OFF',
+         image='test_images/sample_logo.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_cmyw.npy'),
     
     # ========== Size Tests ==========
-    {
-        'name': '4-Color | Small Size (30mm)',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 30.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
-    {
-        'name': '4-Color | Large Size (100mm)',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 100.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
+    case('4-Color | Small Size (30mm)',
+         image='test_images/sample_logo.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy', target_width_mm=30.0),
+    case('4-Color | Large Size (100mm)',
+         image='test_images/sample_logo.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy', target_width_mm=100.0),
     
     # ========== Image Format Tests ==========
-    {
-        'name': '4-Color | PNG Format',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
-    {
-        'name': '4-Color | JPG Format',
-        'image': 'test_images/photo.jpg',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
-    {
-        'name': '4-Color | SVG Format',
-        'image': 'test_images/1.svg',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'vector',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': False,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-    },
+    case('4-Color | PNG Format',
+         image='test_images/sample_logo.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy'),
+    case('4-Color | JPG Format',
+         image='test_images/photo.jpg', lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy'),
+    case('4-Color | SVG Format',
+         image='test_images/1.svg', lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
+         modeling_mode='vector', auto_bg=False),
     
     # ========== Isolated Pixel Cleanup Tests ==========
-    {
-        'name': '4-Color | Isolated Pixel Cleanup ON',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-        'enable_cleanup': True,
-    },
-    {
-        'name': '4-Color | Isolated Pixel Cleanup OFF',
-        'image': 'test_images/sample_logo.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 50.0,
-        'quantize_colors': 64,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': True,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-        'enable_cleanup': False,
-    },
-    {
-        'name': '6-Color | Isolated Pixel Cleanup ON',
-        'image': 'test_images/photo.jpg',
-        'lut': 'lut-npy预设/Custom/Bambulab_basic_cmywgk.npy',
-        'color_mode': '6-Color',
-        'modeling_mode': 'high-fidelity',
-        'target_width_mm': 60.0,
-        'quantize_colors': 128,
-        'blur_kernel': 0,
-        'smooth_sigma': 15,
-        'structure_mode': 'Single-sided',
-        'auto_bg': True,
-        'bg_tol': 15,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 6,
-        'enable_cleanup': True,
-    },
-    {
-        'name': 'Pixel Mode | Cleanup Should Be Disabled',
-        'image': 'test_images/pixel_art.png',
-        'lut': 'lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy',
-        'color_mode': '4-Color',
-        'modeling_mode': 'pixel',
-        'target_width_mm': 40.0,
-        'quantize_colors': 32,
-        'blur_kernel': 0,
-        'smooth_sigma': 10,
-        'structure_mode': 'Double-sided',
-        'auto_bg': False,
-        'bg_tol': 10,
-        'color_replacements': None,
-        'separate_backing': False,
-        'expected_materials': 4,
-        'enable_cleanup': True,  # Should be ignored in pixel mode
-    },
+    case('4-Color | Isolated Pixel Cleanup ON',
+         image='test_images/sample_logo.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy'),
+    case('4-Color | Isolated Pixel Cleanup OFF',
+         image='test_images/sample_logo.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy', enable_cleanup=False),
+    case('6-Color | Isolated Pixel Cleanup ON',
+         image='test_images/photo.jpg', lut='lut-npy预设/Custom/Bambulab_basic_cmywgk.npy',
+         color_mode='6-Color', target_width_mm=60.0, quantize_colors=128, smooth_sigma=15,
+         structure_mode='Single-sided', bg_tol=15, expected_materials=6),
+    case('Pixel Mode | Cleanup Should Be Disabled',
+         image='test_images/pixel_art.png',
+         lut='lut-npy预设/bambulab/bambulab_pla_basic_rybw.npy', modeling_mode='pixel',
+         target_width_mm=40.0, quantize_colors=32, auto_bg=False,
+         enable_cleanup=True),  # Should be ignored in pixel mode
 ]
 
 # Output directory for test results
 TEST_OUTPUT_DIR = os.path.join('output', 'test_results')
 os.makedirs(TEST_OUTPUT_DIR, exist_ok=True)
 
+# One output directory per test case (see _case_output_dir)
+CASE_OUTPUT_DIR = os.path.join(TEST_OUTPUT_DIR, 'cases')
+
+# Fingerprint cache for incremental reruns: {key}.json per passing test case
+CACHE_DIR = os.path.join(TEST_OUTPUT_DIR, '.cache')
+
+# Last measured duration per test name, used to dispatch the longest cases first
+DURATIONS_PATH = os.path.join(TEST_OUTPUT_DIR, 'durations.json')
+
+# Code whose changes invalidate every cached result
+CODE_FILES = ['config.py', 'test_pipeline.py', *glob.glob(os.path.join('core', '*.py')),
+              *glob.glob(os.path.join('utils', '*.py'))]
+
+# Traceback caps for the report (--full-traceback disables them): only the
+# innermost frames are captured, and the rendered text keeps its tail
+TRACEBACK_MAX_FRAMES = 50
+TRACEBACK_MAX_LINES = 200
+TRACEBACK_MAX_CHARS = 8 * 1024
+
+# Number of worker processes (each test case is independent and CPU-bound)
+# (two cores are left for the orchestrating process and the OS)
+MAX_WORKERS = max(1, (os.cpu_count() or 1) - 2)
+
 # ========== Test Result Tracking ==========
 
 class TestResult:
     """Container for test execution results"""
+    __slots__ = ('name', 'passed', 'skipped', 'flaky', 'duration', 'error_message',
+                 'error_traceback', 'validations')
+    
     def __init__(self, name: str):
         self.name = name
         self.passed = False
+        self.skipped = False  # Not run (--fail-fast stopped the suite)
+        self.flaky = False  # Failed, but passed when rerun for diagnostics
         self.duration = 0.0
         self.error_message = None
-        self.error_traceback = None
+        self.error_traceback = None  # str, or a TracebackException formatted on demand
         self.validations = []  # List of (check_name, passed, message)
     
+    def __getstate__(self):
+        # Exception types/frames don't reliably pickle, so a traceback leaving
+        # a worker process is formatted here, at most once per failed test
+        state = {slot: getattr(self, slot) for slot in self.__slots__}
+        state['error_traceback'] = self.format_traceback()
+        return state
+    
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+    
     def add_validation(self, check_name: str, passed: bool, message: str = ""):
         """Add a validation check result"""
         self.validations.append((check_name, passed, message))
@@ -664,11 +367,146 @@ class TestResult:
         """Mark test as passed"""
         self.passed = True
     
-    def mark_failed(self, error_msg: str, error_tb: str = None):
-        """Mark test as failed with error details"""
+    def mark_failed(self, error_msg: str, error_tb=None):
+        """Mark test as failed with error details (error_tb: str or TracebackException)"""
         self.passed = False
         self.error_message = error_msg
         self.error_traceback = error_tb
+    
+    def mark_flaky(self):
+        """Flag a failed test that passed on its diagnostic rerun (still a failure)"""
+        self.flaky = True
+    
+    def mark_skipped(self, reason: str):
+        """Mark test as not run"""
+        self.passed = False
+        self.skipped = True
+        self.error_message = reason
+    
+    def format_traceback(self) -> Optional[str]:
+        """Render the stored traceback (if any) as text"""
+        if isinstance(self.error_traceback, traceback.TracebackException):
+            return ''.join(self.error_traceback.format())
+        return self.error_traceback
+
+
+# ========== Shared Input Cache ==========
+
+def _preflight(test_cases: List[Dict]) -> int:
+    """
+    Check every distinct image/LUT path once and tag each case with the result.
+    
+    Sets test_case['_missing_input'] to an error message (or None), so
+    run_single_test can fail a case before paying for the converter import.
+    
+    Returns:
+        Number of test cases with missing inputs
+    """
+    paths = {tc['image'] for tc in test_cases} | {tc['lut'] for tc in test_cases}
+    exists = {path: os.path.exists(path) for path in paths}
+    
+    missing = 0
+    for tc in test_cases:
+        if not exists[tc['image']]:
+            tc['_missing_input'] = f"Test image not found: {tc['image']}"
+        elif not exists[tc['lut']]:
+            tc['_missing_input'] = f"LUT file not found: {tc['lut']}"
+        else:
+            tc['_missing_input'] = None
+            continue
+        missing += 1
+    return missing
+
+
+def preload_luts(test_cases: List[Dict]) -> int:
+    """
+    Read every distinct LUT file referenced by the test cases once, before the run.
+    
+    convert_image_to_3d only accepts a LUT path and loads it itself for each
+    case; reading the bytes up front just warms the OS page cache so those
+    loads don't hit the disk. Nothing is kept in memory here.
+    
+    Returns:
+        Number of LUT files read
+    """
+    read = 0
+    for lut_path in sorted({tc['lut'] for tc in test_cases}):
+        try:
+            with open(lut_path, 'rb') as f:
+                while f.read(1 << 20):
+                    pass
+            read += 1
+        except OSError:
+            pass  # Missing LUTs are reported by the affected test cases
+    return read
+
+
+# ========== Incremental Rerun Cache ==========
+
+def _stat_key(path: str) -> str:
+    """mtime+size of a file ('missing' if it doesn't exist)"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return f"{path}:missing"
+    return f"{path}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def code_fingerprint() -> str:
+    """Fingerprint of the converter/test code, computed once per run"""
+    return '|'.join(_stat_key(path) for path in sorted(CODE_FILES))
+
+
+def cache_key(test_case: Dict, code_fp: str) -> str:
+    """blake2b over the case config, its input files and the code fingerprint"""
+    config_json = json.dumps({k: v for k, v in test_case.items() if not k.startswith('_')},
+                             sort_keys=True)
+    h = hashlib.blake2b(digest_size=16)
+    for part in (config_json, _stat_key(test_case['image']), _stat_key(test_case['lut']), code_fp):
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def _load_cached_result(test_case: Dict) -> Optional[TestResult]:
+    """Rebuild a passing TestResult if the case is unchanged and its output is untouched"""
+    key = test_case.get('_cache_key')
+    if not key:
+        return None
+    try:
+        with open(os.path.join(CACHE_DIR, f"{key}.json"), encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if _stat_key(entry.get('output', '')) != entry.get('output_stat'):
+        return None  # Output deleted or rewritten since it was validated
+    
+    result = TestResult(test_case['name'])
+    for check_name, passed, message in entry['validations']:
+        result.add_validation(check_name, passed, message)
+    result.add_validation("Cache", True, f"Unchanged since last pass ({entry['duration']:.2f}s)")
+    result.mark_passed()
+    return result
+
+
+def _store_cached_result(test_case: Dict, result: TestResult, output_path: str):
+    """Record a passing result; failures are never cached so they always rerun"""
+    key = test_case.get('_cache_key')
+    if not key:
+        return
+    entry = {
+        'name': result.name,
+        'output': output_path,
+        'output_stat': _stat_key(output_path),
+        'duration': result.duration,
+        'validations': result.validations,
+    }
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(os.path.join(CACHE_DIR, f"{key}.json"), 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+    except OSError:
+        pass  # Cache is best-effort
 
 
 # ========== Validation Functions ==========
@@ -680,34 +518,48 @@ def validate_file_generated(output_path: str) -> Tuple[bool, str]:
     Returns:
         (passed, message)
     """
-    if not os.path.exists(output_path):
+    # One stat() for both the existence and the size check
+    try:
+        file_size = os.stat(output_path).st_size
+    except FileNotFoundError:
         return False, f"File not found: {output_path}"
     
-    file_size = os.path.getsize(output_path)
     if file_size == 0:
         return False, f"File is empty (0 bytes): {output_path}"
     
     return True, f"File generated ({file_size:,} bytes)"
 
 
-def validate_mesh_integrity(output_path: str) -> Tuple[bool, str]:
+def load_mesh(output_path: str):
+    """
+    Load a 3MF (Scene or Trimesh) once, so every validator can share it
+    
+    Returns:
+        (loaded, error_message) - loaded is None if loading failed
+    """
+    if trimesh is None:
+        return None, "Failed to load mesh: trimesh is not installed"
+    try:
+        return trimesh.load(output_path), None
+    except Exception as e:
+        return None, f"Failed to load mesh: {e}"
+
+
+def validate_mesh_integrity(loaded) -> Tuple[bool, str]:
     """
     Validate mesh integrity using trimesh
     
     Checks:
-    - File can be loaded
     - Has vertices and faces
     - Mesh is not degenerate
     
+    Args:
+        loaded: Scene/Trimesh returned by load_mesh()
+    
     Returns:
         (passed, message)
     """
     try:
-        import trimesh
-        
-        # Load mesh/scene
-        loaded = trimesh.load(output_path)
-        
         # Handle both Scene and Mesh objects
         if isinstance(loaded, trimesh.Scene):
             # Count total vertices and faces across all geometries
@@ -738,25 +590,21 @@ def validate_mesh_integrity(output_path: str) -> Tuple[bool, str]:
             return False, f"Unknown geometry type: {type(loaded)}"
     
     except Exception as e:
-        return False, f"Failed to load mesh: {e}"
+        return False, f"Failed to inspect mesh: {e}"
 
 
-def validate_material_slots(output_path: str, expected_count: int) -> Tuple[bool, str]:
+def validate_material_slots(loaded, expected_count: int) -> Tuple[bool, str]:
     """
     Validate number of material slots/objects in the model
     
     Args:
-        output_path: Path to 3MF file
+        loaded: Scene/Trimesh returned by load_mesh()
         expected_count: Expected number of materials
     
     Returns:
         (passed, message)
     """
     try:
-        import trimesh
-        
-        loaded = trimesh.load(output_path)
-        
         if isinstance(loaded, trimesh.Scene):
             actual_count = len(loaded.geometry)
             
@@ -780,34 +628,214 @@ def validate_material_slots(output_path: str, expected_count: int) -> Tuple[bool
 
 # ========== Core Test Runner ==========
 
-def run_single_test(test_case: Dict) -> TestResult:
+# Slot of this process: 0 in the main process, 0..MAX_WORKERS-1 in pool
+# workers (handed out by _init_worker)
+_WORKER_SLOT = 0
+
+# Shared array (one entry per slot) holding the index of the case each pool
+# worker is running, 0 when idle; None outside a pool
+_RUNNING = None
+
+
+def missing_input_result(test_case: Dict) -> Optional[TestResult]:
+    """Failed TestResult if the case's inputs are missing (None if it can run)"""
+    if '_missing_input' not in test_case:
+        _preflight([test_case])
+    if not test_case['_missing_input']:
+        return None
+    result = TestResult(test_case['name'])
+    result.mark_failed(test_case['_missing_input'])
+    return result
+
+
+def crashed_result(test_case: Dict, error: BaseException) -> TestResult:
+    """
+    Failed TestResult for a case whose worker never returned one
+    
+    A worker that dies abruptly (segfault, OOM kill, os._exit) breaks the
+    whole pool; the cases running on it at that moment end up here, while
+    the ones that never started are resubmitted to a fresh pool.
+    """
+    result = TestResult(test_case['name'])
+    if isinstance(error, BrokenProcessPool):
+        msg = f"Worker process died before this case finished (pool broken): {error}"
+    else:
+        msg = f"Worker error: {type(error).__name__}: {error}"
+    result.mark_failed(msg, traceback.TracebackException.from_exception(
+        error, limit=-TRACEBACK_MAX_FRAMES, capture_locals=False, lookup_lines=False))
+    return result
+
+
+def _case_output_dir(test_case: Dict) -> str:
+    """
+    Output directory of one test case, named after it
+    
+    Test cases share image names, so a shared directory would have them
+    overwrite each other's 3MF files (also across parallel workers). With
+    one directory per case, a cached result's output file can only have
+    been written by that case.
+    """
+    return os.path.join(CASE_OUTPUT_DIR, re.sub(r'[^0-9A-Za-z]+', '_', test_case['name']).strip('_'))
+
+
+def prune_worker_dirs() -> int:
+    """
+    Remove the w<N> output directories of older runs (per-PID and then
+    per-worker-slot layouts, replaced by per-case directories)
+    
+    Returns:
+        Number of directories removed
+    """
+    removed = 0
+    for entry in os.scandir(TEST_OUTPUT_DIR):
+        name = entry.name
+        if entry.is_dir() and name[:1] == 'w' and name[1:].isdigit():
+            shutil.rmtree(entry.path, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+# Modules the forkserver imports once; every worker is forked from it with
+# these already loaded (missing ones are skipped by multiprocessing)
+FORKSERVER_PRELOAD = ['__main__', 'numpy', 'trimesh', 'config', 'core.converter']
+
+
+def _pool_context():
+    """
+    Start workers from a forkserver where the platform has one.
+    
+    Forking the main process directly is unsafe once it has started threads
+    (numpy/BLAS, the executor's own management thread), and spawn
+    re-imports everything per worker. Returns None (platform default,
+    i.e. spawn on Windows) when forkserver is unavailable.
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return None
+    ctx = multiprocessing.get_context('forkserver')
+    ctx.set_forkserver_preload(FORKSERVER_PRELOAD)
+    return ctx
+
+
+def _init_worker(slot_counter=None, running=None):
+    """
+    Import the heavy modules once per worker process.
+    
+    Runs as the ProcessPoolExecutor initializer (or once up front on the
+    sequential path), so the first test in each worker doesn't pay for the
+    converter/numpy import chain inside its timed region (trimesh is
+    already imported at module level).
+    
+    Args:
+        slot_counter: Shared multiprocessing.Value; each worker takes the next
+            index as its slot (None: keep slot 0)
+        running: Shared array where the worker records the case it is running
+            (see _call_in_slot)
+    """
+    global _WORKER_SLOT, _RUNNING
+    _RUNNING = running
+    if slot_counter is not None:
+        with slot_counter.get_lock():
+            _WORKER_SLOT = slot_counter.value
+            slot_counter.value += 1
+    
+    import core.converter  # noqa: F401
+    import config  # noqa: F401
+
+
+def _make_pool(running) -> ProcessPoolExecutor:
+    """
+    Worker pool whose processes get slots 0..MAX_WORKERS-1 and
+    record the case they are running in running[slot]
+    """
+    ctx = _pool_context() or multiprocessing.get_context()
+    return ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=ctx,
+                               initializer=_init_worker, initargs=(ctx.Value('i', 0), running))
+
+
+def _call_in_slot(fn, index: int, test_case: Dict):
+    """fn(test_case) in a pool worker, with the case marked as running in this slot"""
+    _RUNNING[_WORKER_SLOT] = index
+    try:
+        return fn(test_case)
+    finally:
+        _RUNNING[_WORKER_SLOT] = 0
+
+
+def run_single_test(test_case: Dict, output_dir: Optional[str] = None,
+                    quiet: bool = False, full_traceback: bool = False) -> TestResult:
     """
     Run a single test case with full isolation
     
     Args:
         test_case: Test configuration dictionary
+        output_dir: Where the converter writes its files (default: per-case subdir)
+        quiet: Discard converter/test stdout and stderr (the TestResult is unaffected)
+        full_traceback: Capture every frame of a failure (default: innermost
+            TRACEBACK_MAX_FRAMES)
     
     Returns:
         TestResult object
     """
+    tb_limit = None if full_traceback else -TRACEBACK_MAX_FRAMES
+    if not quiet:
+        return _run_test_case(test_case, output_dir, tb_limit)
+    
+    with open(os.devnull, 'w') as devnull, \
+            contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+        return _run_test_case(test_case, output_dir, tb_limit)
+
+
+def rerun_for_diagnostics(test_case: Dict, full_traceback: bool = False) -> Tuple[TestResult, str]:
+    """
+    Rerun a failed case with its output captured, for the failure report
+    
+    The result cache is neither read nor written, so a rerun that happens to
+    pass can't record the case as passing.
+    
+    Returns:
+        (rerun TestResult, captured stdout/stderr)
+    """
+    uncached = {k: v for k, v in test_case.items() if k != '_cache_key'}
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+        result = run_single_test(uncached, full_traceback=full_traceback)
+    return result, buf.getvalue()
+
+
+def _run_test_case(test_case: Dict, output_dir: Optional[str],
+                   tb_limit: Optional[int]) -> TestResult:
+    """Body of run_single_test (output not redirected)"""
     result = TestResult(test_case['name'])
+    
+    # Inputs are normally checked once for the whole batch by main(), and
+    # cases with missing inputs never reach this point
+    missing = missing_input_result(test_case)
+    if missing is not None:
+        return missing
+    
+    cached = _load_cached_result(test_case)
+    if cached is not None:
+        return cached
+    
+    output_3mf = None
     start_time = time.time()
     
     try:
         # Import converter (lazy import to avoid startup issues)
+        import core.converter
         from core.converter import convert_image_to_3d
         from config import ModelingMode
         
+        # Redirect converter output: test cases share image names and would otherwise
+        # overwrite each other's 3MF files
+        output_dir = output_dir or _case_output_dir(test_case)
+        os.makedirs(output_dir, exist_ok=True)
+        core.converter.OUTPUT_DIR = output_dir
+        
         # Prepare parameters
         image_path = test_case['image']
         lut_path = test_case['lut']
         
-        # Validate input files exist
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"Test image not found: {image_path}")
-        if not os.path.exists(lut_path):
-            raise FileNotFoundError(f"LUT file not found: {lut_path}")
-        
         # Convert modeling mode string to enum
         mode_str = test_case['modeling_mode']
         if mode_str == 'high-fidelity':
@@ -846,9 +874,13 @@ def run_single_test(test_case: Dict) -> TestResult:
             enable_cleanup=test_case.get('enable_cleanup', True),  # Default to True
         )
         
+        # Validation failures are expected outcomes, not bugs: record them and
+        # return early instead of raising (no exception/traceback per failure)
+        
         # Validation 1: Check if conversion succeeded
         if output_3mf is None:
-            raise RuntimeError(f"Conversion failed: {status_msg}")
+            result.mark_failed(f"Conversion failed: {status_msg}")
+            return result
         
         result.add_validation("Conversion", True, "Completed successfully")
         
@@ -856,17 +888,25 @@ def run_single_test(test_case: Dict) -> TestResult:
         passed, msg = validate_file_generated(output_3mf)
         result.add_validation("File Generation", passed, msg)
         if not passed:
-            raise RuntimeError(msg)
+            result.mark_failed(msg)
+            return result
+        
+        # Load the 3MF once and share it between the mesh validators
+        loaded, load_error = load_mesh(output_3mf)
         
         # Validation 3: Mesh integrity
-        passed, msg = validate_mesh_integrity(output_3mf)
+        if loaded is None:
+            passed, msg = False, load_error
+        else:
+            passed, msg = validate_mesh_integrity(loaded)
         result.add_validation("Mesh Integrity", passed, msg)
         if not passed:
-            raise RuntimeError(msg)
+            result.mark_failed(msg)
+            return result
         
         # Validation 4: Material slots
         expected_materials = test_case.get('expected_materials', 4)
-        passed, msg = validate_material_slots(output_3mf, expected_materials)
+        passed, msg = validate_material_slots(loaded, expected_materials)
         result.add_validation("Material Slots", passed, msg)
         if not passed:
             # This is a warning, not a failure
@@ -876,111 +916,464 @@ def run_single_test(test_case: Dict) -> TestResult:
         result.mark_passed()
         
     except Exception as e:
-        # Capture error details
+        # Capture error details; source lines are only looked up if the
+        # traceback is actually rendered (a negative limit keeps the
+        # innermost frames)
         error_msg = str(e)
-        error_tb = traceback.format_exc()
+        error_tb = traceback.TracebackException.from_exception(
+            e, limit=tb_limit, capture_locals=False, lookup_lines=False)
         result.mark_failed(error_msg, error_tb)
     
     finally:
         result.duration = time.time() - start_time
     
+    if result.passed:
+        _store_cached_result(test_case, result, output_3mf)
+    
     return result
 
 
+def print_banner():
+    """Print BANNER, writing the precomposed UTF-8 bytes when stdout allows it"""
+    out = sys.stdout
+    # Only a plain UTF-8 TextIOWrapper: colorama's Windows wrapper must see the
+    # ANSI codes, and other console encodings need the text encoder
+    if type(out) is io.TextIOWrapper and codecs.lookup(out.encoding).name == 'utf-8':
+        out.flush()  # Keep ordering with text already buffered
+        out.buffer.write(BANNER_BYTES)
+    else:
+        out.write(BANNER + '\n')
+
+
 def print_test_header(test_name: str, index: int, total: int):
     """Print test case header"""
-    print(f"\n{Fore.CYAN}{Style.BRIGHT}{'='*80}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}{Style.BRIGHT}[{index}/{total}] {test_name}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}{Style.BRIGHT}{'='*80}{Style.RESET_ALL}")
+    print(f"\n{SEP}")
+    print(f"{CYAN_BRIGHT}[{index}/{total}] {test_name}{RESET}")
+    print(SEP)
 
 
 def print_test_result(result: TestResult):
-    """Print test result with color coding"""
-    if result.passed:
-        status = f"{Fore.GREEN}{Style.BRIGHT}[PASS]{Style.RESET_ALL}"
-    else:
-        status = f"{Fore.RED}{Style.BRIGHT}[FAIL]{Style.RESET_ALL}"
+    """Print test result with color coding (one write per result)"""
+    status = STATUS_PASS if result.passed else STATUS_FAIL
     
-    print(f"\n{status} {result.name} ({result.duration:.2f}s)")
+    lines = [f"\n{status} {result.name} ({result.duration:.2f}s)"]
     
-    # Print validation details
+    # Validation details
     for check_name, passed, message in result.validations:
-        if passed:
-            icon = f"{Fore.GREEN}✓{Style.RESET_ALL}"
-        else:
-            icon = f"{Fore.RED}✗{Style.RESET_ALL}"
-        
-        print(f"  {icon} {check_name}: {message}")
+        icon = ICON_PASS if passed else ICON_FAIL
+        lines.append(f"  {icon} {check_name}: {message}")
     
-    # Print error details if failed
+    # Error details if failed
     if not result.passed and result.error_message:
-        print(f"\n  {Fore.RED}Error: {result.error_message}{Style.RESET_ALL}")
+        lines.append(f"\n  {RED}Error: {result.error_message}{RESET}")
+    if result.flaky:
+        lines.append(f"  {YELLOW}⚠️  Passed when rerun for diagnostics (flaky){RESET}")
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def _truncate_traceback(text: str) -> str:
+    """Keep the last TRACEBACK_MAX_LINES lines / TRACEBACK_MAX_CHARS characters"""
+    lines = text.splitlines(keepends=True)
+    kept = ''.join(lines[-TRACEBACK_MAX_LINES:])[-TRACEBACK_MAX_CHARS:]
+    if len(kept) == len(text):
+        return text
+    
+    # Lines removed entirely or cut by the character cap
+    dropped_prefix = text[:len(text) - len(kept)]
+    cut_mid_line = not dropped_prefix.endswith('\n')
+    lines_affected = dropped_prefix.count('\n') + cut_mid_line
+    return (f"... ({len(dropped_prefix):,} characters in {lines_affected} line(s) truncated, "
+            f"use --full-traceback to see all)\n{kept}")
 
 
-def print_summary(results: List[TestResult]):
-    """Print final summary statistics"""
+def _format_failure(result: TestResult, full_traceback: bool = False) -> str:
+    """One FAILED TESTS row: name, error and (if captured) the traceback"""
+    error_tb = result.format_traceback()
+    if error_tb and not full_traceback:
+        error_tb = _truncate_traceback(error_tb)
+    tb_block = f"\n{YELLOW}Traceback:{RESET}\n{error_tb}\n" if error_tb else ""
+    flaky_note = f"  {YELLOW}Flaky: passed when rerun for diagnostics{RESET}\n" if result.flaky else ""
+    return f"{RED_X}{result.name}{RESET}\n  Error: {result.error_message}\n{flaky_note}{tb_block}\n"
+
+
+def print_summary(results: List[TestResult], wall_time: Optional[float] = None,
+                  full_traceback: bool = False):
+    """Print final summary statistics (one write for the whole summary)"""
     total = len(results)
     passed = sum(1 for r in results if r.passed)
-    failed = total - passed
+    skipped = sum(1 for r in results if r.skipped)
+    flaky = sum(1 for r in results if r.flaky)
+    failed = total - passed - skipped
     total_time = sum(r.duration for r in results)
     
-    print(f"\n{Fore.CYAN}{Style.BRIGHT}{'='*80}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}{Style.BRIGHT}TEST SUMMARY{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}{Style.BRIGHT}{'='*80}{Style.RESET_ALL}\n")
-    
-    print(f"Total Tests:  {total}")
-    print(f"{Fore.GREEN}Passed:       {passed}{Style.RESET_ALL}")
-    print(f"{Fore.RED}Failed:       {failed}{Style.RESET_ALL}")
-    print(f"Total Time:   {total_time:.2f}s")
-    print(f"Average Time: {total_time/total:.2f}s per test")
+    buf = io.StringIO()
+    buf.write(
+        f"\n{SEP}\n"
+        f"{CYAN_BRIGHT}TEST SUMMARY{RESET}\n"
+        f"{SEP}\n\n"
+        f"Total Tests:  {total}\n"
+        f"{GREEN}Passed:       {passed}{RESET}\n"
+        f"{RED}Failed:       {failed}{RESET}\n"
+        f"Total Time:   {total_time:.2f}s\n"
+        f"Average Time: {total_time/total:.2f}s per test\n"
+    )
+    if flaky:
+        buf.write(f"{YELLOW}Flaky:        {flaky} (counted as failed){RESET}\n")
+    if skipped:
+        buf.write(f"{YELLOW}Skipped:      {skipped}{RESET}\n")
+    if wall_time is not None:
+        buf.write(f"Wall Time:    {wall_time:.2f}s\n")
     
-    # Print failed tests details
+    # Failed tests details (one string per failure, joined once)
     if failed > 0:
-        print(f"\n{Fore.RED}{Style.BRIGHT}FAILED TESTS:{Style.RESET_ALL}\n")
+        buf.write(f"\n{RED_BRIGHT}FAILED TESTS:{RESET}\n\n")
+        buf.write(''.join(_format_failure(r, full_traceback) for r in results
+                          if not r.passed and not r.skipped))
+    
+    if skipped:
+        buf.write(f"{YELLOW_BRIGHT}SKIPPED TESTS:{RESET}\n\n")
         for result in results:
-            if not result.passed:
-                print(f"{Fore.RED}✗ {result.name}{Style.RESET_ALL}")
-                print(f"  Error: {result.error_message}")
-                if result.error_traceback:
-                    print(f"\n{Fore.YELLOW}Traceback:{Style.RESET_ALL}")
-                    print(result.error_traceback)
-                print()
+            if result.skipped:
+                buf.write(f"{YELLOW}- {result.name}: {result.error_message}{RESET}\n")
+        buf.write("\n")
     
-    print(f"{Fore.CYAN}{Style.BRIGHT}{'='*80}{Style.RESET_ALL}\n")
+    buf.write(f"{SEP}\n\n")
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
     
     # Return exit code
     return 0 if failed == 0 else 1
 
 
+# ========== Machine-Readable Results ==========
+
+def write_results_json(results: List[TestResult], path: str):
+    """Write per-test results as JSON for CI and multi-run aggregation"""
+    data = [
+        {
+            'name': r.name,
+            'passed': r.passed,
+            'skipped': r.skipped,
+            'flaky': r.flaky,
+            'duration': r.duration,
+            'error': r.error_message,
+        }
+        for r in results
+    ]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def load_durations() -> Dict[str, float]:
+    """Durations recorded by the previous run ({} if none)"""
+    try:
+        with open(DURATIONS_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(durations: Dict[str, float], results: List[TestResult]):
+    """
+    Merge measured durations into DURATIONS_PATH
+    
+    Only passing runs are recorded (cached ones report 0s): a case that fails
+    early would otherwise be stored as the shortest and dispatched last once
+    fixed. A failed case's entry is dropped instead, so the next run treats
+    it as never timed and starts it first (which also lets --fail-fast stop
+    early on a known failure).
+    """
+    for r in results:
+        if r.passed:
+            if r.duration > 0:
+                durations[r.name] = r.duration
+        elif not r.skipped:
+            durations.pop(r.name, None)
+    try:
+        with open(DURATIONS_PATH, 'w', encoding='utf-8') as f:
+            json.dump(durations, f, ensure_ascii=False, indent=2)
+    except OSError:
+        pass  # Scheduling hint only
+
+
+def aggregate(paths: List[str]) -> Dict[str, Dict]:
+    """
+    Combine several results JSON files into per-test duration statistics
+    
+    Returns:
+        {test name: {'runs', 'passed', 'min', 'mean', 'median', 'max', 'rsd'}}
+        where rsd is the relative standard deviation in percent
+    """
+    durations = {}
+    passes = {}
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            for entry in json.load(f):
+                durations.setdefault(entry['name'], []).append(entry['duration'])
+                passes[entry['name']] = passes.get(entry['name'], 0) + bool(entry['passed'])
+    
+    stats = {}
+    for name, values in durations.items():
+        mean = statistics.mean(values)
+        stdev = statistics.stdev(values) if len(values) > 1 else 0.0
+        stats[name] = {
+            'runs': len(values),
+            'passed': passes[name],
+            'min': min(values),
+            'mean': mean,
+            'median': statistics.median(values),
+            'max': max(values),
+            'rsd': 100.0 * stdev / mean if mean > 0 else 0.0,
+        }
+    return stats
+
+
+def print_aggregate(stats: Dict[str, Dict]):
+    """Print the per-test statistics returned by aggregate()"""
+    buf = io.StringIO()
+    buf.write(f"\n{SEP}\n{CYAN_BRIGHT}TIMING ACROSS ITERATIONS{RESET}\n{SEP}\n\n")
+    buf.write(f"{'Test':<48} {'Pass':>5} {'Min':>7} {'Mean':>7} {'Median':>7} {'Max':>7} {'RSD':>6}\n")
+    for name, st in stats.items():
+        buf.write(f"{name[:48]:<48} {st['passed']:>2}/{st['runs']:<2} {st['min']:>6.2f}s {st['mean']:>6.2f}s "
+                  f"{st['median']:>6.2f}s {st['max']:>6.2f}s {st['rsd']:>5.1f}%\n")
+    buf.write(f"\n{SEP}\n\n")
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+
+
 # ========== Main Entry Point ==========
 
-def main():
+def _run_cases(cases: List[Tuple[int, Dict]], fn, on_done):
+    """
+    Call fn(test_case) for every (index, test_case) and hand each outcome to
+    on_done(index, test_case, value, error) as soon as it is available
+    
+    Runs in this process when MAX_WORKERS <= 1, otherwise in a worker pool
+    (separate processes bypass the GIL). Only this loop prints, so
+    completions never interleave and no lock is needed. An exception from a
+    worker (including BrokenProcessPool for the cases a dead worker was
+    running) is passed as `error` instead of ending the run; cases a broken
+    pool never started are resubmitted to a new one. If on_done returns
+    True, cases not yet started are cancelled.
+    """
+    if MAX_WORKERS <= 1:
+        # Sequential: no pool overhead, imports happen once in this process
+        _init_worker()
+        for i, test_case in cases:
+            try:
+                value, error = fn(test_case), None
+            except Exception as e:
+                value, error = None, e
+            if on_done(i, test_case, value, error):
+                break
+        return
+    
+    # Indices are 1-based, so 0 marks an idle slot
+    running = (_pool_context() or multiprocessing.get_context()).Array('i', MAX_WORKERS)
+    pending, stopped = list(cases), False
+    while pending and not stopped:
+        broken = []  # Cases failed by a dead worker: (index, test_case, error)
+        with _make_pool(running) as executor:
+            futures = {executor.submit(_call_in_slot, fn, i, tc): (i, tc) for i, tc in pending}
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                i, test_case = futures[future]
+                try:
+                    value, error = future.result(), None
+                except BrokenProcessPool as e:
+                    broken.append((i, test_case, e))
+                    continue
+                except Exception as e:
+                    value, error = None, e
+                if on_done(i, test_case, value, error) and not stopped:
+                    # Drop queued cases; ones already running still get reported
+                    stopped = True
+                    for f in futures:
+                        f.cancel()
+        
+        # The pool is shut down, so `running` now holds the cases its workers
+        # died in. Only those are reported as crashed; the rest never started
+        # and go to a fresh pool. If no slot recorded a case (e.g. a worker
+        # died in its initializer), fail them all rather than loop.
+        died_in = set(running[:]) - {0}
+        running[:] = [0] * MAX_WORKERS
+        pending = []
+        for i, test_case, error in broken:
+            if i in died_in or not died_in:
+                if on_done(i, test_case, None, error):
+                    stopped = True
+            elif not stopped:
+                pending.append((i, test_case))
+
+
+def run_suite(quiet: bool, durations: Optional[Dict[str, float]] = None,
+              fail_fast: bool = False, full_traceback: bool = False) -> List[TestResult]:
+    """
+    Run every test case once, reporting each result as it completes
+    
+    Args:
+        quiet: Run pass 1 without converter output, then rerun failures with
+            their output captured for the report (pass 1 decides the verdict)
+        durations: Previous durations by test name; parallel runs dispatch the
+            longest cases first (LPT) so a straggler doesn't start last
+        fail_fast: Stop starting new cases after the first failure; the cases
+            that never ran are returned as skipped, and nothing is rerun
+        full_traceback: Capture untruncated tracebacks
+    
+    Returns:
+        TestResults in test case order
+    """
+    results = {}  # index -> TestResult
+    crashed = set()  # Indices whose worker died; not rerun
+    
+    def report(i: int, test_case: Dict, result: TestResult):
+        results[i] = result
+        print_test_header(test_case['name'], i, len(TEST_CASES))
+        print_test_result(result)
+        sys.stdout.flush()
+    
+    # Cases with missing inputs fail right here; only runnable ones are dispatched
+    runnable = []
+    for i, test_case in enumerate(TEST_CASES, 1):
+        missing = missing_input_result(test_case)
+        if missing is None:
+            runnable.append((i, test_case))
+        else:
+            report(i, test_case, missing)
+    if fail_fast and len(runnable) < len(TEST_CASES):
+        runnable = []
+    
+    if MAX_WORKERS > 1:
+        # Cases never timed before are assumed long and start first
+        durations = durations or {}
+        runnable.sort(key=lambda item: -durations.get(item[1]['name'], float('inf')))
+    
+    # Pass 1
+    def on_result(i: int, test_case: Dict, result: Optional[TestResult], error) -> bool:
+        if error is not None:
+            # A crashed worker must not take the rest of the report with it
+            result = crashed_result(test_case, error)
+            crashed.add(i)
+        report(i, test_case, result)
+        return fail_fast and not result.passed
+    
+    _run_cases(runnable, functools.partial(run_single_test, quiet=quiet,
+                                           full_traceback=full_traceback), on_result)
+    
+    for i, test_case in enumerate(TEST_CASES, 1):
+        if i not in results:
+            results[i] = TestResult(test_case['name'])
+            results[i].mark_skipped("Not run (--fail-fast)")
+    
+    # Pass 2: rerun failures (in parallel) with their output captured, and print
+    # each one's output in a single block. The pass-1 result stays the verdict;
+    # a rerun that passes only marks the case as flaky.
+    rerun = [(i, TEST_CASES[i - 1]) for i in sorted(results)
+             if not results[i].passed and not results[i].skipped
+             and not TEST_CASES[i - 1]['_missing_input'] and i not in crashed]
+    if quiet and rerun and not fail_fast:
+        print(f"\n{YELLOW_BRIGHT}Re-running {len(rerun)} failed test(s) with full output...{RESET}")
+        sys.stdout.flush()
+        
+        def on_rerun(i: int, test_case: Dict, value, error) -> bool:
+            result = results[i]
+            if error is not None:
+                output = f"(diagnostic rerun failed: {type(error).__name__}: {error})\n"
+            else:
+                rerun_result, output = value
+                if rerun_result.passed:
+                    result.mark_flaky()
+            print_test_header(test_case['name'], i, len(TEST_CASES))
+            sys.stdout.write(output)
+            print_test_result(result)
+            sys.stdout.flush()
+            return False
+        
+        _run_cases(rerun, functools.partial(rerun_for_diagnostics,
+                                            full_traceback=full_traceback), on_rerun)
+    
+    return [results[i] for i in sorted(results)]
+
+
+def main(argv: Optional[List[str]] = None):
     """Main test runner"""
-    print(f"{Fore.CYAN}{Style.BRIGHT}")
-    print("╔═══════════════════════════════════════════════════════════════════════════════╗")
-    print("║                    LUMINA STUDIO - AUTOMATED TEST PIPELINE                    ║")
-    print("╚═══════════════════════════════════════════════════════════════════════════════╝")
-    print(f"{Style.RESET_ALL}\n")
+    parser = argparse.ArgumentParser(description="Lumina Studio automated test pipeline")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="rerun every case, ignoring results cached from unchanged inputs")
+    parser.add_argument('--verbose', action='store_true',
+                        help="show converter output for every case (default: only for failed cases)")
+    parser.add_argument('--test-iterations', type=int, default=1, metavar='N',
+                        help="run the suite N times and report per-test timing statistics "
+                             "(implies --no-cache)")
+    parser.add_argument('--fail-fast', action='store_true',
+                        help="stop starting new test cases after the first failure")
+    parser.add_argument('--full-traceback', action='store_true',
+                        help=f"report complete tracebacks (default: last {TRACEBACK_MAX_FRAMES} frames, "
+                             f"{TRACEBACK_MAX_LINES} lines)")
+    args = parser.parse_args(argv)
+    if args.test_iterations < 1:
+        parser.error("--test-iterations must be at least 1")
+    
+    # Block-buffer the console (a TTY is line-buffered by default, and -u /
+    # PYTHONUNBUFFERED makes every write go straight through); output is
+    # flushed explicitly once per section instead of once per line.
+    # Worker processes started fresh (spawn/forkserver) read the environment.
+    os.environ.pop('PYTHONUNBUFFERED', None)
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.reconfigure(line_buffering=False, write_through=False)
+        except (AttributeError, ValueError):
+            pass  # Not a TextIOWrapper (e.g. redirected to a custom stream)
+    
+    print_banner()
     
     print(f"Test Output Directory: {TEST_OUTPUT_DIR}")
-    print(f"Total Test Cases: {len(TEST_CASES)}\n")
+    print(f"Total Test Cases: {len(TEST_CASES)}")
+    print(f"Worker Processes: {MAX_WORKERS}")
+    print(f"Pruned Dirs:      {prune_worker_dirs()}")
+    print(f"Missing Inputs:   {_preflight(TEST_CASES)}")
+    print(f"Preloaded LUTs:   {preload_luts(TEST_CASES)}")
     
-    results = []
+    # Cached results take 0s, which would make timing statistics meaningless
+    if args.no_cache or args.test_iterations > 1:
+        print("Result Cache:     disabled\n")
+    else:
+        code_fp = code_fingerprint()
+        for tc in TEST_CASES:
+            tc['_cache_key'] = cache_key(tc, code_fp)
+        print(f"Result Cache:     {CACHE_DIR}\n")
+    sys.stdout.flush()
     
-    # Run all test cases
-    for i, test_case in enumerate(TEST_CASES, 1):
-        print_test_header(test_case['name'], i, len(TEST_CASES))
+    # Pass 1 runs quietly; only failed cases are rerun with full output
+    quiet = not args.verbose
+    
+    durations = load_durations()
+    exit_code = 0
+    json_paths = []
+    for iteration in range(1, args.test_iterations + 1):
+        if args.test_iterations > 1:
+            print(f"\n{CYAN_BRIGHT}ITERATION {iteration}/{args.test_iterations}{RESET}")
+            json_path = os.path.join(TEST_OUTPUT_DIR, f"results_{iteration}.json")
+        else:
+            json_path = os.path.join(TEST_OUTPUT_DIR, "results.json")
         
-        # Run test with full isolation
-        result = run_single_test(test_case)
-        results.append(result)
+        wall_start = time.time()
+        results = run_suite(quiet, durations, fail_fast=args.fail_fast,
+                            full_traceback=args.full_traceback)
+        save_durations(durations, results)
         
-        # Print immediate result
-        print_test_result(result)
+        # Print final summary (in test case order)
+        exit_code = max(exit_code, print_summary(results, wall_time=time.time() - wall_start,
+                                                 full_traceback=args.full_traceback))
+        write_results_json(results, json_path)
+        json_paths.append(json_path)
     
-    # Print final summary
-    exit_code = print_summary(results)
+    if args.test_iterations > 1:
+        print_aggregate(aggregate(json_paths))
     
+    print(f"JSON results: {', '.join(json_paths)}")
     return exit_code
 
 
@@ -989,9 +1382,9 @@ if __name__ == "__main__":
         exit_code = main()
         sys.exit(exit_code)
     except KeyboardInterrupt:
-        print(f"\n{Fore.YELLOW}Test interrupted by user{Style.RESET_ALL}")
+        print(f"\n{YELLOW}Test interrupted by user{RESET}")
         sys.exit(130)
     except Exception as e:
-        print(f"\n{Fore.RED}Fatal error: {e}{Style.RESET_ALL}")
+        print(f"\n{RED}Fatal error: {e}{RESET}")
         traceback.print_exc()
         sys.exit(1)